@@ -1,9 +1,13 @@
 # src/pid_parts/state.py
+import sys
+
 from pydantic import BaseModel
+from pydantic.dataclasses import dataclass
 from typing import Optional, Tuple, Dict
 
 
-class Item(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Item:
     tag: str
     type: str
     size: Optional[str] = None
@@ -11,6 +15,13 @@ class Item(BaseModel):
     conf: float
     status: str = "INGESTED"
 
+    def __post_init__(self):
+        # type/size/status come from a small vocabulary; share one copy each
+        object.__setattr__(self, "type", sys.intern(self.type))
+        object.__setattr__(self, "status", sys.intern(self.status))
+        if self.size is not None:
+            object.__setattr__(self, "size", sys.intern(self.size))
+
 
 class State(BaseModel):
     items: Dict[str, Item] = {}
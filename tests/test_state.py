@@ -1,4 +1,8 @@
 # tests/test_state.py
+import dataclasses
+
+import pytest
+
 from pid_parts.state import Item
 
 
@@ -7,3 +11,18 @@ def test_item_defaults():
         tag="PT-101", type="Pressure Transmitter", bbox=(0, 0, 10, 10), conf=0.99
     )
     assert itm.status == "INGESTED"
+
+
+def test_item_is_frozen_and_slotted():
+    itm = Item(tag="PT-101", type="PT", bbox=(0, 0, 10, 10), conf=0.99)
+    assert not hasattr(itm, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        itm.status = "CONFIRMED"
+    assert dataclasses.replace(itm, status="CONFIRMED").status == "CONFIRMED"
+
+
+def test_item_interns_vocabulary_strings():
+    a = Item(tag="PT-101", type="".join(["P", "T"]), bbox=(0, 0, 1, 1), conf=0.9)
+    b = Item(tag="PT-102", type="".join(["P", "T"]), bbox=(0, 0, 1, 1), conf=0.9)
+    assert a.type is b.type
+    assert a.status is b.status